@@ -1,274 +1,420 @@
-import requests
-import pandas as pd
-from datetime import datetime, timedelta
-import re
-import os
-
-# === CONFIG ===
-ZONES = {
-    "AMZ651": "miami",  # Miami coastal waters (3-letter day abbrev)
-    "GMZ044": "keys"    # Keys coastal waters (full day names)
-}
-OUTPUT_DIR = "../data/output"
-OUTPUT_FILE = "marine_forecast.csv"
-CWF_URLS = {
-    "AMZ651": "https://forecast.weather.gov/product.php?site=MFL&issuedby=MFL&product=CWF",
-    "GMZ044": "https://forecast.weather.gov/product.php?site=NWS&issuedby=KEY&product=CWF"
-}
-
-# === FUNCTION TO FETCH AND EXTRACT FORECAST ===
-def get_zone_forecast(zone_id, zone_type):
-    try:
-        url = CWF_URLS[zone_id]
-        response = requests.get(url)
-        response.raise_for_status()
-        # Remove HTML tags
-        text = re.sub(r"<.*?>", "", response.text, flags=re.DOTALL)
-    except Exception as e:
-        print(f"⚠ Error fetching {zone_id}: {e}")
-        return None
-
-    # --- Extract the full zone block ---
-    if zone_id == "GMZ044":
-        pattern_zone = re.compile(
-            r"(?:GMZ042[\->]044|GMZ044)(?:[^\n]*)\n(.*?)(?=\n\$|\Z)",
-            re.DOTALL
-        )
-    else:
-        pattern_zone = re.compile(
-            rf"{zone_id}(?:[^\n]*)\n(.*?)(?=\n\$|\Z)",
-            re.DOTALL
-        )
-
-    zone_match = pattern_zone.search(text)
-    if not zone_match:
-        print(f"⚠ No forecast found for zone {zone_id}")
-        return None
-
-    zone_text = zone_match.group(1)
-    lines = zone_text.splitlines()
-
-    # --- Detect Small Craft Caution / Advisory ---
-    text_lower = zone_text.lower()
-    caution_flag = 1 if "caution" in text_lower else 0
-    advisory_flag = 1 if "advisory" in text_lower else 0
-    both_flag = 1 if ("caution" in text_lower and "advisory" in text_lower) else 0
-    no_alert_flag = 1 if (caution_flag == 0 and advisory_flag == 0) else 0
-
-    # --- Extract advisory/caution text (between first and last '...') ---
-    advisory_text = ""
-    if ("caution" in text_lower or "advisory" in text_lower):
-        advisory_match = re.search(r"\.\.\.(.*?)\.\.\.", zone_text, re.DOTALL)
-        if advisory_match:
-            advisory_text = advisory_match.group(1).strip()
-
-    # --- Determine which day to capture ---
-    now = datetime.now()
-    if now.hour < 12:
-        # Before noon: use today
-        target_day = "Today"
-        day_labels = ["TODAY", now.strftime("%a").upper(), now.strftime("%A").upper()]
-    else:
-        # After noon: use tomorrow
-        target_day = "Tomorrow"
-        tomorrow = now + timedelta(days=1)
-        day_labels = [tomorrow.strftime("%a").upper(), tomorrow.strftime("%A").upper()]
-
-    # --- Line-by-line capture of forecast for target day ---
-    forecast_lines = []
-    capture = False
-
-    for line in lines:
-        line_clean = line.strip()
-        if not line_clean:
-            continue
-
-        # Start capturing when we hit the target day header
-        if any(line_clean.startswith(f".{label}") for label in day_labels):
-            capture = True
-            # Remove the label from the line text
-            for label in day_labels:
-                line_clean = re.sub(rf"^\.{label}\.*", "", line_clean, flags=re.I).strip()
-            if line_clean:
-                forecast_lines.append(line_clean)
-            continue
-
-        # Stop if another forecast header starts
-        if capture and line_clean.startswith(".") and not any(line_clean.startswith(f".{label}") for label in day_labels):
-            break
-
-        if capture:
-            forecast_lines.append(line_clean)
-
-    if not forecast_lines:
-        print(f"⚠ No forecast found for {zone_id} on target day ({day_labels})")
-        return None
-
-    # --- Combine forecast lines ---
-    full_text = " ".join([re.sub(r"\s+", " ", l) for l in forecast_lines])
-
-    # --- Trim forecast at the next day header (e.g., TONIGHT, THU, FRIDAY, etc.) ---
-    # This prevents leftover text like "RSDAY..."
-    cutoff_pattern = re.compile(
-        r"\b(?:TONIGHT|NIGHT|MON|TUE|WED|THU|FRI|SAT|SUN|MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)\b",
-        re.IGNORECASE
-    )
-    cutoff_match = cutoff_pattern.search(full_text)
-    if cutoff_match:
-        forecast_text = full_text[:cutoff_match.start()].strip()
-    else:
-        forecast_text = full_text.strip()
-
-    return {
-        "Zone": zone_id,
-        "City": ZONES[zone_id].capitalize(),
-        "Day": target_day,  # Returns "Today" or "Tomorrow"
-        "Forecast": forecast_text,
-        "SmallCraftCaution": caution_flag,
-        "SmallCraftAdvisory": advisory_flag,
-        "BothMentioned": both_flag,
-        "NoAlert": no_alert_flag,
-        "AdvisoryText": advisory_text,
-        "Retrieved": datetime.now().strftime("%Y-%m-%d %I:%M %p")
-    }
-
-
-
-# === GATHER FORECASTS ===
-forecast_list = []
-for zone_id, zone_type in ZONES.items():
-    result = get_zone_forecast(zone_id, zone_type)
-    if result:
-        forecast_list.append(result)
-
-# --- SAVE RESULTS ---
-df = pd.DataFrame(forecast_list)
-
-# --- Direction mapping ---
-DIRECTION_MAP = {
-    "north": "N",
-    "northeast": "NE",
-    "east": "E",
-    "southeast": "SE",
-    "south": "S",
-    "southwest": "SW",
-    "west": "W",
-    "northwest": "NW"
-}
-
-# --- Normalize full direction to abbreviation ---
-def normalize_wind(text):
-    if not isinstance(text, str) or not text:
-        return ""
-    text = text.lower()
-    
-    for full, abbr in DIRECTION_MAP.items():
-        text = re.sub(rf"\b{full}\b", abbr, text)
-    
-    text = re.sub(r"\bwinds?\b", "", text)
-    text = re.sub(r"\s+to\s+", "-", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    text = re.sub(r"\b(knots?|kt)\b", "kts", text)
-    return text
-
-# --- Flexible wind extraction with optional gusts, all units as kts ---
-def extract_wind_field(forecast_text):
-    if not isinstance(forecast_text, str):
-        return ""
-    
-    match = re.search(
-        r"\b((?:north|northeast|east|southeast|south|southwest|west|northwest|N|NE|E|SE|S|SW|W|NW)"
-        r"(?:\s*to\s*(?:north|northeast|east|southeast|south|southwest|west|northwest|N|NE|E|SE|S|SW|W|NW))?"
-        r"\s*winds?\s*(?:around\s*|near\s*)?\d{1,2}(?:\s*(?:to|-)\s*\d{1,2})?)\s*(?:kt|kts|knots)",
-        forecast_text, re.I
-    )
-    
-    if not match:
-        return ""
-    
-    wind_speed = normalize_wind(match.group(1))
-    wind_speed = re.sub(r"\b(around|near)\b\s*", "", wind_speed, flags=re.I)
-
-    gust_match = re.search(
-        r"gusts?\s*(?:up to\s*)?(\d{1,2})\s*(?:kt|kts|knots)?",
-        forecast_text, re.I
-    )
-    if gust_match:
-        gust_value = gust_match.group(1)
-        wind_speed += f" ({gust_value})"
-
-    return f"{wind_speed} kts"
-
-# --- Extract seas field ---
-def extract_seas_field(forecast_text):
-    if not isinstance(forecast_text, str):
-        return ""
-
-    seas_match = re.search(
-        r"Seas\s+(?:around\s+)?([\d.]+(?:\s*(?:to|-)\s*[\d.]+)?)\s*(?:feet|ft)"
-        r"(?:,\s*occasionally\s*(?:to\s*)?([\d.]+)\s*(?:feet|ft))?",
-        forecast_text, re.I
-    )
-
-    if seas_match:
-        base_range = seas_match.group(1).strip()
-        occasional = seas_match.group(2)
-        base_range = re.sub(r"\s*to\s*", "-", base_range)
-
-        if re.search(r"\bSeas\s+around\s+", forecast_text, re.I):
-            base_range = "around " + base_range
-
-        seas_text = base_range
-        if occasional:
-            seas_text += f" ({occasional})"
-        seas_text += " ft"
-        return seas_text.strip()
-    return ""
-
-def extract_intracoastal(forecast_text):
-    if not isinstance(forecast_text, str):
-        return ""
-
-    match = re.search(
-        r"(Intracoastal|Nearshore)\s+waters\s+(?:will be\s+|are\s+)?([^.]+)",
-        forecast_text,
-        re.I
-    )
-    if not match:
-        return ""
-
-    desc = match.group(2).strip().lower()
-    desc = re.split(r",|becoming", desc)[0].strip()
-    desc = desc.replace("in exposed areas", "").strip()
-
-    # --- Normalize severity terms ---
-    if "rough" in desc:
-        return "rough"
-    elif "choppy" in desc:
-        return "choppy"
-    elif "moderate" in desc:
-        return "mod chop"
-    elif "light" in desc:
-        return "light chop"
-    elif "smooth" in desc:
-        return "smooth"
-
-    return desc
-
-# --- Apply extraction ---
-df["Winds"] = df["Forecast"].apply(extract_wind_field)
-df["Seas"] = df["Forecast"].apply(extract_seas_field)
-df["Intracoastal"] = df["Forecast"].apply(extract_intracoastal)
-
-# --- Clean up spacing ---
-for col in ["Seas", "Intracoastal"]:
-    df[col] = df[col].str.replace(r"\s+", " ", regex=True).str.strip()
-
-# Ensure output directory exists
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-# Local save
-local_path = os.path.join(OUTPUT_DIR, OUTPUT_FILE)
-df.to_csv(local_path, index=False)
-
-
+import requests
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import re
+import os
+
+# Optional: Google RE2 (pip install pyre2) matches in guaranteed linear
+# time with no backtracking. The pure-regular hot patterns below use it
+# when available and silently fall back to the stdlib engine otherwise.
+# Patterns that need backreferences (the wind clauses) stay on re.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# === CONFIG ===
+ZONES = {
+    "AMZ651": "miami",  # Miami coastal waters (3-letter day abbrev)
+    "GMZ044": "keys"    # Keys coastal waters (full day names)
+}
+OUTPUT_DIR = "../data/output"
+OUTPUT_FILE = "marine_forecast.csv"
+CWF_URLS = {
+    "AMZ651": "https://forecast.weather.gov/product.php?site=MFL&issuedby=MFL&product=CWF",
+    "GMZ044": "https://forecast.weather.gov/product.php?site=NWS&issuedby=KEY&product=CWF"
+}
+
+# Shared session so all zone fetches reuse one connection pool
+# (keep-alive amortizes the TCP/TLS handshake across zones)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# --- Direction mapping ---
+DIRECTION_MAP = {
+    "north": "N",
+    "northeast": "NE",
+    "east": "E",
+    "southeast": "SE",
+    "south": "S",
+    "southwest": "SW",
+    "west": "W",
+    "northwest": "NW"
+}
+
+# === PRECOMPILED PATTERNS ===
+# All patterns are compiled once at import so the compile cost is not paid
+# per zone / per row inside the parsing functions.
+
+
+def _zone_prefixes(zone_id):
+    if zone_id == "GMZ044":
+        # GMZ044 can appear alone or inside a combined GMZ042-044 header
+        return ("GMZ042-044", "GMZ042>044", "GMZ044")
+    return (zone_id,)
+
+
+_ZONE_PREFIXES = {zone_id: _zone_prefixes(zone_id) for zone_id in ZONES}
+
+
+def _slice_zone(text, prefixes):
+    """Slice the zone block out of the product with plain find() calls.
+
+    Finds the earliest header prefix, skips the rest of the header
+    line, and cuts at the next "\\n$" terminator (or end of text).
+    Pure substring search, so a product missing its terminator costs a
+    single linear scan instead of a backtracking regex pass.
+    """
+    hits = [h for h in (text.find(p) for p in prefixes) if h >= 0]
+    if not hits:
+        return None
+    start = text.find("\n", min(hits))
+    if start < 0:
+        return None
+    end = text.find("\n$", start + 1)
+    return text[start + 1:end if end >= 0 else len(text)]
+
+# Trim forecast at the next day header (e.g., TONIGHT, THU, FRIDAY, etc.)
+# This prevents leftover text like "RSDAY..."
+_CUTOFF_RE = _re.compile(
+    r"\b(?:TONIGHT|NIGHT|MON|TUE|WED|THU|FRI|SAT|SUN|MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)\b",
+    re.IGNORECASE
+)
+
+# Token -> replacement table for normalize_wind: direction words become
+# abbreviations, "winds"/"wind" is dropped, units collapse to "kts",
+# and "to" becomes the range hyphen
+_WIND_TOKEN_MAP = {
+    **DIRECTION_MAP,
+    "wind": "",
+    "winds": "",
+    "knot": "kts",
+    "knots": "kts",
+    "kt": "kts",
+    "to": "-",
+}
+
+# Direction alternation ordered longest-first so the engine never
+# commits to a prefix ("north") and has to back out of "northeast".
+# The (?=(?P<g>...))(?P=g) wrapper emulates an atomic group: the
+# lookahead picks the direction once and the backreference consumes it,
+# so a later failure cannot re-enter the alternation.
+_DIR_ALT = "northeast|northwest|southeast|southwest|north|south|east|west|NE|NW|SE|SW|N|S|E|W"
+
+_WIND_RE = re.compile(
+    rf"\b((?=(?P<d1>{_DIR_ALT}))(?P=d1)"
+    rf"(?:\s*to\s*(?=(?P<d2>{_DIR_ALT}))(?P=d2))?"
+    r"\s*winds?\s*(?:around\s*|near\s*)?\d{1,2}(?:\s*(?:to|-)\s*\d{1,2})?)\s*(?:kt|kts|knots)",
+    re.I
+)
+_AROUND_NEAR_RE = re.compile(r"\b(around|near)\b\s*", re.I)
+_GUST_RE = re.compile(
+    r"gusts?\s*(?:up to\s*)?(\d{1,2})\s*(?:kt|kts|knots)?",
+    re.I
+)
+
+_SEAS_RE = re.compile(
+    r"Seas\s+(?:around\s+)?(?P<range>[\d.]+(?:\s*(?:to|-)\s*[\d.]+)?)\s*(?:feet|ft)"
+    r"(?:,\s*occasionally\s*(?:to\s*)?(?P<occ>[\d.]+)\s*(?:feet|ft))?",
+    re.I
+)
+_SEAS_AROUND_RE = re.compile(r"\bSeas\s+around\s+", re.I)
+_SEAS_TO_RE = re.compile(r"\s*to\s*")
+
+_INTRACOASTAL_RE = re.compile(
+    r"(?P<which>Intracoastal|Nearshore)\s+waters\s+(?:will be\s+|are\s+)?(?P<desc>[^.]+)",
+    re.I
+)
+_INTRA_SPLIT_RE = re.compile(r",|becoming")
+
+# === TARGET DAY ===
+# The script is one-shot, so the target day, its header labels, and the
+# block pattern built from them are computed once at import instead of
+# once per zone.
+_NOW = datetime.now()
+if _NOW.hour < 12:
+    # Before noon: use today
+    TARGET_DAY = "Today"
+    _DAY_LABELS = ["TODAY", _NOW.strftime("%a").upper(), _NOW.strftime("%A").upper()]
+else:
+    # After noon: use tomorrow
+    TARGET_DAY = "Tomorrow"
+    _TOMORROW = _NOW + timedelta(days=1)
+    _DAY_LABELS = [_TOMORROW.strftime("%a").upper(), _TOMORROW.strftime("%A").upper()]
+
+# Header prefixes for locating the day block with plain find(), and a
+# small regex just to strip the leading ".LABEL..." token off the block
+_DAY_LABEL_PREFIXES = tuple("." + label for label in _DAY_LABELS)
+_DAY_HEADER_RE = re.compile(
+    rf"^\.(?:{'|'.join(_DAY_LABELS)})\b\.*[ \t]*"
+)
+
+
+# --- Strip HTML tags in a single linear pass ---
+# Faster than re.sub(r"<.*?>", ...) on a full NWS page: no backtracking
+# and no per-match object overhead, just find() hops between tags.
+def _strip_tags(html):
+    out = []
+    i = 0
+    n = len(html)
+    while i < n:
+        j = html.find("<", i)
+        if j < 0:
+            out.append(html[i:])
+            break
+        out.append(html[i:j])
+        k = html.find(">", j + 1)
+        if k < 0:
+            break
+        i = k + 1
+    return "".join(out)
+
+
+# === FUNCTION TO FETCH AND EXTRACT FORECAST ===
+def get_zone_forecast(zone_id, zone_type, session=SESSION):
+    try:
+        url = CWF_URLS[zone_id]
+        response = session.get(url, timeout=10)
+        response.raise_for_status()
+        # Decode once, explicitly: the NWS pages are ASCII, and
+        # response.text can fall back to charset detection over the
+        # whole body when the server omits the charset header
+        text = _strip_tags(response.content.decode("utf-8", errors="replace"))
+    except Exception as e:
+        print(f"⚠ Error fetching {zone_id}: {e}")
+        return None
+
+    # --- Extract the full zone block ---
+    zone_text = _slice_zone(text, _ZONE_PREFIXES[zone_id])
+    if zone_text is None:
+        print(f"⚠ No forecast found for zone {zone_id}")
+        return None
+
+    # --- Detect Small Craft Caution / Advisory ---
+    # One substring scan per keyword; the four flags are derived from
+    # the two booleans instead of re-scanning the zone text
+    text_lower = zone_text.lower()
+    has_caution = "caution" in text_lower
+    has_advisory = "advisory" in text_lower
+    caution_flag = int(has_caution)
+    advisory_flag = int(has_advisory)
+    both_flag = int(has_caution & has_advisory)
+    no_alert_flag = int(not (has_caution | has_advisory))
+
+    # --- Extract advisory/caution text (between the first two '...') ---
+    # Plain find() twice instead of a lazy regex: the markers are
+    # literals, so two C-level substring searches do the same job
+    advisory_text = ""
+    if has_caution or has_advisory:
+        i = zone_text.find("...")
+        j = zone_text.find("...", i + 3) if i >= 0 else -1
+        if j >= 0:
+            advisory_text = zone_text[i + 3:j].strip()
+
+    # --- Capture the forecast block for the target day ---
+    # Index arithmetic on the zone text instead of splitlines(): find
+    # the earliest day header at a line start, cut at the next header
+    # line, and collapse whitespace in one split/join. No per-line
+    # string objects are built.
+    starts = []
+    for prefix in _DAY_LABEL_PREFIXES:
+        if zone_text.startswith(prefix):
+            starts.append(0)
+        hit = zone_text.find("\n" + prefix)
+        if hit >= 0:
+            starts.append(hit + 1)
+    if not starts:
+        print(f"⚠ No forecast found for {zone_id} on target day ({_DAY_LABELS})")
+        return None
+
+    i = min(starts)
+    j = zone_text.find("\n.", i + 1)
+    block = zone_text[i:j] if j >= 0 else zone_text[i:]
+
+    # Strip the leading ".LABEL..." token off the block
+    header_match = _DAY_HEADER_RE.match(block)
+    if header_match:
+        block = block[header_match.end():]
+
+    full_text = " ".join(block.split())
+    if not full_text:
+        print(f"⚠ No forecast found for {zone_id} on target day ({_DAY_LABELS})")
+        return None
+
+    # --- Trim forecast at the next day header ---
+    cutoff_match = _CUTOFF_RE.search(full_text)
+    if cutoff_match:
+        forecast_text = full_text[:cutoff_match.start()].strip()
+    else:
+        forecast_text = full_text.strip()
+
+    return {
+        "Zone": zone_id,
+        "City": ZONES[zone_id].capitalize(),
+        "Day": TARGET_DAY,  # "Today" or "Tomorrow"
+        "Forecast": forecast_text,
+        "SmallCraftCaution": caution_flag,
+        "SmallCraftAdvisory": advisory_flag,
+        "BothMentioned": both_flag,
+        "NoAlert": no_alert_flag,
+        "AdvisoryText": advisory_text,
+        "Retrieved": datetime.now().strftime("%Y-%m-%d %I:%M %p")
+    }
+
+
+# --- Normalize full direction to abbreviation ---
+def normalize_wind(text):
+    if not isinstance(text, str) or not text:
+        return ""
+
+    # Single pass over the tokens: every replacement (directions,
+    # dropping "winds", unit spelling, "to" -> "-") comes from one
+    # table lookup, and whitespace is collapsed by the split/join
+    # itself. Wind clauses contain only words, digits, and spaces, so
+    # whole-token matching is safe.
+    out = []
+    glue = False
+    for token in text.lower().split():
+        token = _WIND_TOKEN_MAP.get(token, token)
+        if not token:
+            continue
+        if token == "-":
+            # Range hyphen joins its neighbors ("5 to 10" -> "5-10")
+            glue = bool(out)
+            continue
+        if glue:
+            out[-1] += "-" + token
+            glue = False
+        else:
+            out.append(token)
+    return " ".join(out)
+
+
+# --- Flexible wind extraction with optional gusts, all units as kts ---
+def extract_wind_field(forecast_text):
+    if not isinstance(forecast_text, str):
+        return ""
+
+    match = _WIND_RE.search(forecast_text)
+    if not match:
+        return ""
+
+    wind_speed = normalize_wind(match.group(1))
+    wind_speed = _AROUND_NEAR_RE.sub("", wind_speed)
+
+    gust_match = _GUST_RE.search(forecast_text)
+    if gust_match:
+        gust_value = gust_match.group(1)
+        wind_speed += f" ({gust_value})"
+
+    return f"{wind_speed} kts"
+
+
+# --- Extract seas field ---
+def extract_seas_field(forecast_text):
+    if not isinstance(forecast_text, str):
+        return ""
+
+    seas_match = _SEAS_RE.search(forecast_text)
+
+    if seas_match:
+        base_range = seas_match.group(1).strip()
+        occasional = seas_match.group(2)
+        base_range = _SEAS_TO_RE.sub("-", base_range)
+
+        if _SEAS_AROUND_RE.search(forecast_text):
+            base_range = "around " + base_range
+
+        seas_text = base_range
+        if occasional:
+            seas_text += f" ({occasional})"
+        seas_text += " ft"
+        return seas_text.strip()
+    return ""
+
+
+def extract_intracoastal(forecast_text):
+    if not isinstance(forecast_text, str):
+        return ""
+
+    match = _INTRACOASTAL_RE.search(forecast_text)
+    if not match:
+        return ""
+
+    desc = match.group(2).strip().lower()
+    desc = _INTRA_SPLIT_RE.split(desc)[0].strip()
+    desc = desc.replace("in exposed areas", "").strip()
+
+    # --- Normalize severity terms ---
+    if "rough" in desc:
+        return "rough"
+    elif "choppy" in desc:
+        return "choppy"
+    elif "moderate" in desc:
+        return "mod chop"
+    elif "light" in desc:
+        return "light chop"
+    elif "smooth" in desc:
+        return "smooth"
+
+    return desc
+
+
+# --- All derived fields for one forecast in a single pass ---
+# Whitespace is normalized at the source (split/join collapses runs and
+# strips the ends), so no per-column cleanup pass is needed afterwards.
+# Each extractor runs behind a literal keyword check: a C-level
+# substring scan that skips the full regex pass when the field cannot
+# be present in the row at all.
+def _extract_all(forecast_text):
+    lower = forecast_text.lower() if isinstance(forecast_text, str) else ""
+    winds = (
+        extract_wind_field(forecast_text)
+        if ("kt" in lower or "knot" in lower) else ""
+    )
+    seas = extract_seas_field(forecast_text) if "seas" in lower else ""
+    intracoastal = (
+        extract_intracoastal(forecast_text)
+        if ("intracoastal" in lower or "nearshore" in lower) else ""
+    )
+    return {
+        "Winds": " ".join(winds.split()),
+        "Seas": " ".join(seas.split()),
+        "Intracoastal": " ".join(intracoastal.split()),
+    }
+
+
+# === GATHER FORECASTS ===
+# Fetch all zones concurrently; total wall time is the slowest fetch
+# instead of the sum of every fetch
+with ThreadPoolExecutor(max_workers=len(ZONES)) as executor:
+    results = executor.map(
+        lambda item: get_zone_forecast(item[0], item[1], SESSION), ZONES.items()
+    )
+    forecast_list = [result for result in results if result]
+
+# --- Apply extraction (one pass per record, fields arrive already
+# whitespace-normalized) ---
+for record in forecast_list:
+    record.update(_extract_all(record["Forecast"]))
+
+# --- SAVE RESULTS ---
+# csv.DictWriter on the records directly: for a handful of rows the
+# DataFrame round-trip bought nothing but the pandas import time
+FIELDS = [
+    "Zone", "City", "Day", "Forecast",
+    "SmallCraftCaution", "SmallCraftAdvisory", "BothMentioned", "NoAlert",
+    "AdvisoryText", "Retrieved", "Winds", "Seas", "Intracoastal",
+]
+
+# Ensure output directory exists
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# Local save
+local_path = os.path.join(OUTPUT_DIR, OUTPUT_FILE)
+with open(local_path, "w", newline="") as f:
+    writer = csv.DictWriter(f, fieldnames=FIELDS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(forecast_list)